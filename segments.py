@@ -2,250 +2,328 @@
 import os
 import shutil
 import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+# numpy
+import numpy as np
+# scipy (optional, falls back to a pure Python union-find)
+try:
+    from scipy import ndimage
+except ImportError:
+    ndimage = None
+# numba (optional, JIT-compiles the union-find fallback)
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 # pillow
 from PIL import Image, ImageDraw
 from PIL.PngImagePlugin import PngInfo
 # ezdxf
-import ezdxf
+from ezdxf.addons.r12writer import R12FastStreamWriter
 # aci_table.py
 import aci_table as LUT
 
-# rgb to hex
-def rgb_to_hex(color):
-    r, g, b = color
-    return f"{r:02X}{g:02X}{b:02X}"
-
-# rgb array to hex array
-def convert_array_to_hex(rgb_array):
-    return [
-        [
-            rgb_to_hex(pixel[:3]) if pixel[3] > 0 else None  # ignore transparent pixels
-            for pixel in row
-        ]
-        for row in rgb_array
-    ]
-
-# find closest matching ACI color (according to aci_table.py)
-def find_closest_aci(hex_color):
-    r, g, b = int(hex_color[:2], 16), int(hex_color[2:4], 16), int(hex_color[4:], 16)
-    closest_color = min(
-        LUT.ACI_COLORS.items(),
-        key=lambda aci: (r - aci[1][0])**2 + (g - aci[1][1])**2 + (b - aci[1][2])**2
-    )
-    return closest_color[0]
-
-# create rgb color array from image
+# sentinel label for transparent pixels (outside the 24 bit RGB range)
+TRANSPARENT = 0xFFFFFFFF
+
+# packed uint32 label back to hex (only used when emitting layer/file names)
+def label_to_hex(label):
+    return f"{label:06X}"
+
+# pack rgba array into a (height, width) uint32 label array (0xRRGGBB)
+def pack_labels(rgb_array):
+    r = rgb_array[..., 0].astype(np.uint32)
+    g = rgb_array[..., 1].astype(np.uint32)
+    b = rgb_array[..., 2].astype(np.uint32)
+    labels = (r << 16) | (g << 8) | b
+    labels[rgb_array[..., 3] == 0] = TRANSPARENT  # ignore transparent pixels
+    return labels
+
+# build a 32x32x32 rgb -> ACI lookup table (5 bit per channel, according to aci_table.py)
+def build_aci_lut():
+    aci_colors = np.array([LUT.ACI_COLORS[i] for i in range(len(LUT.ACI_COLORS))], dtype=np.int32)
+    # bin centers of the quantized channels
+    centers = np.arange(32, dtype=np.int32) * 8 + 4
+    r, g, b = np.meshgrid(centers, centers, centers, indexing="ij")
+    bins = np.stack([r, g, b], axis=-1).reshape(-1, 1, 3)
+    # nearest ACI color per bin by squared rgb distance
+    distances = ((bins - aci_colors.reshape(1, -1, 3)) ** 2).sum(axis=-1)
+    return np.argmin(distances, axis=1).astype(np.uint8).reshape(32, 32, 32)
+
+# built once at import time (~32KB)
+ACI_LUT = build_aci_lut()
+
+# find closest matching ACI color for a packed uint32 label
+def find_closest_aci(label):
+    return int(ACI_LUT[(label >> 19) & 0x1F, (label >> 11) & 0x1F, (label >> 3) & 0x1F])
+
+# create rgba color array from image
 def create_color_array(input_path):
-    img = Image.open(input_path).convert("RGBA")
-    width, height = img.size
-    return [[img.getpixel((x, y)) for x in range(width)] for y in range(height)]
+    # one C-level buffer copy instead of one getpixel() call per pixel
+    return np.array(Image.open(input_path).convert("RGBA"), dtype=np.uint8)
+
+# 4-connectivity, same neighborhood as the old flood fill
+CONNECTIVITY = [[0, 1, 0], [1, 1, 1], [0, 1, 0]]
 
 # find connected regions of the same color
-def find_connected_regions(color_array):
-    height, width = len(color_array), len(color_array[0])
-    visited = [[False for _ in range(width)] for _ in range(height)]
+def find_connected_regions(labels):
+    if ndimage is not None:
+        return find_connected_regions_scipy(labels)
+    return find_connected_regions_union_find(labels)
+
+# connected component labeling with scipy (one C call per unique color)
+def find_connected_regions_scipy(labels):
     regions = {}
 
-    def explore_region(x, y, color):
-        stack = [(x, y)]
-        region = []
+    for color in np.unique(labels):
+        if color == TRANSPARENT:  # ignore transparent pixels
+            continue
+        # C-level connected component labeling instead of a Python flood fill
+        components, count = ndimage.label(labels == color, structure=CONNECTIVITY)
+        for i in range(1, count + 1):
+            # each region is a (k, 2) int32 array of (y, x) coordinates
+            regions.setdefault(int(color), []).append(np.argwhere(components == i).astype(np.int32))
 
-        while stack:
-            cx, cy = stack.pop()
-            if not (0 <= cx < width and 0 <= cy < height) or visited[cy][cx] or color_array[cy][cx] != color:
-                continue
-            visited[cy][cx] = True
-            region.append((cx, cy))
-            stack.extend([(cx + 1, cy), (cx - 1, cy), (cx, cy + 1), (cx, cy - 1)])
-        return region
+    return regions
 
+# component root per pixel: weighted quick union with path compression over flat indices
+def union_find_roots(flat, height, width, transparent):
+    size = height * width
+    parent = np.arange(size, dtype=np.int32)
+    rank = np.zeros(size, dtype=np.int8)
+
+    def find(i):
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        # path compression
+        while parent[i] != root:
+            next_i = parent[i]
+            parent[i] = root
+            i = next_i
+        return root
+
+    def union(i, j):
+        root_i, root_j = find(i), find(j)
+        if root_i == root_j:
+            return
+        # union by rank
+        if rank[root_i] < rank[root_j]:
+            root_i, root_j = root_j, root_i
+        parent[root_j] = root_i
+        if rank[root_i] == rank[root_j]:
+            rank[root_i] += 1
+
+    # raster scan: union same-color right and down neighbor pairs (4-connectivity)
     for y in range(height):
         for x in range(width):
-            if not visited[y][x] and color_array[y][x] is not None:  # ignore transparent pixels
-                color = color_array[y][x]
-                region = explore_region(x, y, color)
-                if region:
-                    regions.setdefault(color, []).append(region)
+            i = y * width + x
+            color = flat[i]
+            if color == transparent:
+                continue
+            if x + 1 < width and flat[i + 1] == color:
+                union(i, i + 1)
+            if y + 1 < height and flat[i + width] == color:
+                union(i, i + width)
 
-    return regions
+    # flatten every pixel to its final root
+    for i in range(size):
+        parent[i] = find(i)
 
-# remove "Defpoints" DXF layer
-def remove_defpoints(doc):
-    if "Defpoints" in doc.layers:
-        doc.layers.remove("Defpoints")
-
-# remove duplicate DXF lines
-def remove_duplicates(doc, unit):
-    msp = doc.modelspace()
-    unique_lines = set()
-
-    for entity in msp:
-        if entity.dxftype() == 'LINE':
-            start = (entity.dxf.start.x, entity.dxf.start.y)
-            end = (entity.dxf.end.x, entity.dxf.end.y)
-            # sort tuple so that lines with mirrored start and end points are identical
-            line = tuple(sorted([start, end]))
-            # adding "lines" to unique_lines set removes duplicates automatically
-            unique_lines.add(line)
-    
-    clean_doc = ezdxf.new()
-    clean_doc.header["$INSUNITS"] = unit
-    remove_defpoints(clean_doc)
-    clean_msp = clean_doc.modelspace()
+    return parent
 
-    for start, end in unique_lines:
-        clean_msp.add_line(start, end)
+# compile the per-pixel kernel to native code when numba is available
+if njit is not None:
+    union_find_roots = njit(cache=True)(union_find_roots)
 
-    return clean_doc
+# fallback without scipy: union-find connected component labeling
+def find_connected_regions_union_find(labels):
+    height, width = labels.shape
+    flat = labels.ravel()
+    roots = union_find_roots(flat, height, width, TRANSPARENT)
 
-# draw DXF outlines
-def draw_region_outlines(regions, output_path, pixel_size, unit, mode):
-    doc = ezdxf.new()
-    doc.header["$INSUNITS"] = unit
+    # group pixels by component root
+    components = {}
+    for i in np.flatnonzero(flat != TRANSPARENT):
+        components.setdefault(int(roots[i]), []).append(i)
 
-    remove_defpoints(doc)
+    regions = {}
+    for indices in components.values():
+        color = int(flat[indices[0]])
+        indices = np.asarray(indices, dtype=np.int32)
+        region = np.stack([indices // width, indices % width], axis=1)
+        regions.setdefault(color, []).append(region)
 
-    for hex_color, color_regions in regions.items():
-        aci_color = find_closest_aci(hex_color) if mode == "multi_colored" else 7
-        layer_name = "segments" if mode == "mono" else f"#{hex_color}"
+    return regions
+
+# per-side border masks for a region mask (True where a pixel needs a border on that side)
+def edge_masks(mask):
+    top = mask.copy()
+    top[1:, :] &= ~mask[:-1, :]
+    bottom = mask.copy()
+    bottom[:-1, :] &= ~mask[1:, :]
+    left = mask.copy()
+    left[:, 1:] &= ~mask[:, :-1]
+    right = mask.copy()
+    right[:, :-1] &= ~mask[:, 1:]
+    return top, bottom, left, right
+
+# merge consecutive True pixels per row into (y, start, end) runs (end is exclusive)
+def horizontal_runs(mask):
+    runs = []
+    for y in range(mask.shape[0]):
+        # pad the row so np.diff also catches runs touching the borders
+        padded = np.concatenate(([False], mask[y], [False])).astype(np.int8)
+        starts = np.flatnonzero(np.diff(padded) == 1)
+        ends = np.flatnonzero(np.diff(padded) == -1)
+        runs.extend((y, int(start), int(end)) for start, end in zip(starts, ends))
+    return runs
+
+# merge consecutive True pixels per column into (x, start, end) runs (end is exclusive)
+def vertical_runs(mask):
+    return horizontal_runs(mask.T)
+
+# build a boolean bitmap of a region, cropped to its bounding box
+def region_mask(region):
+    y0, x0 = region.min(axis=0)
+    y1, x1 = region.max(axis=0)
+    mask = np.zeros((y1 - y0 + 1, x1 - x0 + 1), dtype=bool)
+    mask[region[:, 0] - y0, region[:, 1] - x0] = True
+    return mask, y0, x0
+
+# collect the outline segments of all regions of one color as (start, end) tuples
+def region_outline_lines(color_regions, pixel_size):
+    lines = []
+
+    for region in color_regions:
+        # shift-and-compare edge maps instead of per-pixel neighbor lookups
+        mask, y0, x0 = region_mask(region)
+        top, bottom, left, right = edge_masks(mask)
+
+        # coalesce collinear unit segments into single lines
+        for y, start, end in horizontal_runs(top):
+            lines.append((((x0 + start) * pixel_size, -(y0 + y) * pixel_size), ((x0 + end) * pixel_size, -(y0 + y) * pixel_size)))
+        for y, start, end in horizontal_runs(bottom):
+            lines.append((((x0 + start) * pixel_size, -(y0 + y + 1) * pixel_size), ((x0 + end) * pixel_size, -(y0 + y + 1) * pixel_size)))
+        for x, start, end in vertical_runs(left):
+            lines.append((((x0 + x) * pixel_size, -(y0 + start) * pixel_size), ((x0 + x) * pixel_size, -(y0 + end) * pixel_size)))
+        for x, start, end in vertical_runs(right):
+            lines.append((((x0 + x + 1) * pixel_size, -(y0 + start) * pixel_size), ((x0 + x + 1) * pixel_size, -(y0 + end) * pixel_size)))
+
+    return lines
+
+# hand-written R12 preamble: header with units plus a layer table with colors
+def write_r12_preamble(stream, unit, layers):
+    stream.write(f"0\nSECTION\n2\nHEADER\n9\n$INSUNITS\n70\n{unit}\n0\nENDSEC\n")
+    stream.write(f"0\nSECTION\n2\nTABLES\n0\nTABLE\n2\nLAYER\n70\n{len(layers)}\n")
+    for layer_name, aci_color in layers.items():
+        stream.write(f"0\nLAYER\n2\n{layer_name}\n70\n0\n62\n{aci_color}\n6\nCONTINUOUS\n")
+    stream.write("0\nENDTAB\n0\nENDSEC\n")
 
-        # singles (create new doc)
-        if mode == "singles":
-            single_doc = ezdxf.new()
-            single_doc.header["$INSUNITS"] = unit
-            remove_defpoints(doc)
-
-            single_doc.layers.add(name=layer_name, color=aci_color)
-            msp = single_doc.modelspace()
-
-        # multi region
-        else:
-            if layer_name not in doc.layers:
-                doc.layers.add(name=layer_name, color=aci_color)
-            msp = doc.modelspace()
-
-        # create outlines
-        for region in color_regions:
-            for x, y in region:
-                if (x - 1, y) not in region:
-                    msp.add_line((x * pixel_size, -y * pixel_size), (x * pixel_size, -(y + 1) * pixel_size), {"layer": layer_name})
-                if (x + 1, y) not in region:
-                    msp.add_line(((x + 1) * pixel_size, -y * pixel_size), ((x + 1) * pixel_size, -(y + 1) * pixel_size), {"layer": layer_name})
-                if (x, y - 1) not in region:
-                    msp.add_line((x * pixel_size, -y * pixel_size), ((x + 1) * pixel_size, -y * pixel_size), {"layer": layer_name})
-                if (x, y + 1) not in region:
-                    msp.add_line((x * pixel_size, -(y + 1) * pixel_size), ((x + 1) * pixel_size, -(y + 1) * pixel_size), {"layer": layer_name})
-
-            # singles
-            if mode == "singles":
-                single_doc.saveas(os.path.join(output_path, f"HEX_{layer_name.lstrip('#')}.dxf"))
-
-    # multi region
-    if mode != "singles":
-        # if mode is mono outline DXF -> remove all duplicate lines
-        if mode == "mono":
-            doc = remove_duplicates(doc, unit)
-        # save DXF
-        doc.saveas(f"{output_path}.dxf")
-
-# check if a border should be drawn by comparing neighboring pixels
-def needs_border(rgb_array, x, y, dx, dy, color):
-    neighbor_x = x + dx
-    neighbor_y = y + dy
-    height = len(rgb_array)
-    width = len(rgb_array[0])
-
-    # check if out of bounds
-    if neighbor_x < 0 or neighbor_x >= width or neighbor_y < 0 or neighbor_y >= height:
-        return True  # needs border at the edge
-
-    neighbor_pixel = rgb_array[neighbor_y][neighbor_x]
-
-    # check if neighbor is transparent or a different color
-    return neighbor_pixel[3] == 0 or tuple(neighbor_pixel[:3]) != color
+# draw DXF outlines
+def draw_region_outlines(regions, output_path, pixel_size, unit, mode, color_to_aci):
+    # singles (one file per color, streamed like the combined modes)
+    if mode == "singles":
+        for label, color_regions in regions.items():
+            hex_color = label_to_hex(label)
+            layer_name = f"#{hex_color}"
+
+            with open(os.path.join(output_path, f"HEX_{hex_color}.dxf"), "wt", encoding="cp1252") as stream:
+                write_r12_preamble(stream, unit, {layer_name: 7})
+                writer = R12FastStreamWriter(stream)
+                for start, end in region_outline_lines(color_regions, pixel_size):
+                    writer.add_line(start, end, layer=layer_name)
+                writer.close()
+        return
+
+    # multi region: collect layers and lines first
+    layers = {}
+    lines = []
+
+    for label, color_regions in regions.items():
+        hex_color = label_to_hex(label)
+        aci_color = color_to_aci[label] if mode == "multi_colored" else 7
+        layer_name = "segments" if mode == "mono" else f"#{hex_color}"
+        layers[layer_name] = aci_color
+
+        for start, end in region_outline_lines(color_regions, pixel_size):
+            lines.append((start, end, layer_name))
+
+    # if mode is mono outline DXF -> remove all duplicate lines
+    if mode == "mono":
+        # sort start and end points so that mirrored lines are identical
+        unique_lines = {tuple(sorted([start, end])) for start, end, _ in lines}
+        # the deduplicated lines go on the default layer, like the old rebuilt document
+        lines = [(start, end, "0") for start, end in unique_lines]
+        layers = {}
+
+    # stream LINE records directly to disk instead of building an ezdxf document
+    with open(f"{output_path}.dxf", "wt", encoding="cp1252") as stream:
+        write_r12_preamble(stream, unit, layers)
+        writer = R12FastStreamWriter(stream)
+        for start, end, layer_name in lines:
+            writer.add_line(start, end, layer=layer_name)
+        writer.close()
 
 # create single PNG images for every color
-def array_to_pngs(rgb_array, png_folder):
-    width = len(rgb_array[0])
-    height = len(rgb_array)
+def array_to_pngs(labels, rgb_array, png_folder, unique_labels):
+    height, width = labels.shape
 
-    unique_colors = set(tuple(pixel[:3]) for row in rgb_array for pixel in row if pixel[3] > 0)
-    
-    for color in unique_colors:
-        img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-        
-        for y in range(height):
-            for x in range(width):
-                current_color = rgb_array[y][x]
-                
-                if current_color[3] > 0 and current_color[:3] == color:  # ignore transparent pixels
-                    img.putpixel((x, y), current_color)
-        
-        # output path
-        hex_color = rgb_to_hex(color).lstrip('#')
-        output_image_path = os.path.join(png_folder, f"HEX_{hex_color}.png")
-        # save single color PNG
-        img.save(output_image_path)
+    # libpng releases the GIL while compressing -> overlap the saves across threads
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = []
+
+        for label in unique_labels:
+            # one boolean mask assignment instead of a putpixel call per pixel
+            single = np.zeros((height, width, 4), dtype=np.uint8)
+            mask = labels == label
+            single[mask] = rgb_array[mask]
+
+            # output path
+            hex_color = label_to_hex(int(label))
+            output_image_path = os.path.join(png_folder, f"HEX_{hex_color}.png")
+            # save single color PNG
+            futures.append(executor.submit(Image.fromarray(single, "RGBA").save, output_image_path))
+
+        # re-raise any worker exception
+        for future in futures:
+            future.result()
 
 # create printable black/white PNG containing all regions as outlines
-def array_to_scaled_png(rgb_array, png_folder, pixel_size, unit, line_width, dpi, output_name):
+def array_to_scaled_png(labels, png_folder, pixel_size, unit, line_width, dpi, output_name, unique_labels):
     # convert pixel size to pixels based on unit and dpi
     pixel_size_in_pixels = int(pixel_size * dpi / (25.4 if unit == "mm" else 1))
 
-    width, height = len(rgb_array[0]), len(rgb_array)
+    height, width = labels.shape
 
     img = Image.new("RGBA", (width * pixel_size_in_pixels, height * pixel_size_in_pixels), (255, 255, 255, 255))
     draw = ImageDraw.Draw(img)
 
-    # identify unique colors (excluding transparent pixels)
-    unique_colors = set(tuple(pixel[:3]) for row in rgb_array for pixel in row if pixel[3] > 0)
-
-    for color in unique_colors:
-        region_pixels = set()
-
-        # find pixels belonging to current color
-        for y in range(height):
-            for x in range(width):
-                if tuple(rgb_array[y][x][:3]) == color and rgb_array[y][x][3] > 0:  
-                    # ignore transparent pixels
-                    region_pixels.add((x, y))
+    for label in unique_labels:
+        # borders where a neighbor is a different color or transparent, computed on the
+        # small label array and scaled up -> one draw call per run instead of per pixel
+        top, bottom, left, right = edge_masks(labels == label)
 
-        for x, y in region_pixels:
-            top_left = (x * pixel_size_in_pixels, y * pixel_size_in_pixels)
-            bottom_right = ((x + 1) * pixel_size_in_pixels, (y + 1) * pixel_size_in_pixels)
-
-            # preserve transparent pixels
-            if rgb_array[y][x][3] == 0:
-                continue
-
-            # check borders and draw line if a neighbor is different or transparent
-            # top
-            if needs_border(rgb_array, x, y, 0, -1, color):
-                draw.line(
-                    [(top_left[0], top_left[1]), (bottom_right[0], top_left[1])], 
-                    fill="black", width=line_width
-                )
-
-            # bottom
-            if needs_border(rgb_array, x, y, 0, 1, color):
-                draw.line(
-                    [(top_left[0], bottom_right[1]), (bottom_right[0], bottom_right[1])], 
-                    fill="black", width=line_width
-                )
-
-            # left
-            if needs_border(rgb_array, x, y, -1, 0, color):
-                draw.line(
-                    [(top_left[0], top_left[1]), (top_left[0], bottom_right[1])], 
-                    fill="black", width=line_width
-                )
-
-            # right
-            if needs_border(rgb_array, x, y, 1, 0, color):
-                draw.line(
-                    [(bottom_right[0], top_left[1]), (bottom_right[0], bottom_right[1])], 
-                    fill="black", width=line_width
-                )
+        for y, start, end in horizontal_runs(top):
+            draw.line(
+                [(start * pixel_size_in_pixels, y * pixel_size_in_pixels), (end * pixel_size_in_pixels, y * pixel_size_in_pixels)],
+                fill="black", width=line_width
+            )
+        for y, start, end in horizontal_runs(bottom):
+            draw.line(
+                [(start * pixel_size_in_pixels, (y + 1) * pixel_size_in_pixels), (end * pixel_size_in_pixels, (y + 1) * pixel_size_in_pixels)],
+                fill="black", width=line_width
+            )
+        for x, start, end in vertical_runs(left):
+            draw.line(
+                [(x * pixel_size_in_pixels, start * pixel_size_in_pixels), (x * pixel_size_in_pixels, end * pixel_size_in_pixels)],
+                fill="black", width=line_width
+            )
+        for x, start, end in vertical_runs(right):
+            draw.line(
+                [((x + 1) * pixel_size_in_pixels, start * pixel_size_in_pixels), ((x + 1) * pixel_size_in_pixels, end * pixel_size_in_pixels)],
+                fill="black", width=line_width
+            )
 
     # output path
     output_image_path = os.path.join(png_folder, f"{output_name}_print.png")
@@ -320,30 +398,63 @@ def main():
 
     # create arrays and regions
     color_array = create_color_array(input_image_path)
-    hex_array = convert_array_to_hex(color_array)
-    regions = find_connected_regions(hex_array)
+    labels = pack_labels(color_array)
+    regions = find_connected_regions(labels)
+
+    # unique colors, computed once for every consumer (excluding transparent pixels)
+    unique_labels = np.unique(labels)
+    unique_labels = unique_labels[unique_labels != TRANSPARENT]
+
+    # look up the ACI color for every color once, not once per DXF mode
+    color_to_aci = {label: find_closest_aci(label) for label in regions}
 
     # DXF output options
     dxf_options = ["mono", "multi", "multi_colored"]
 
-    # multi layer DXF files
-    for option in dxf_options:
-        draw_region_outlines(
-            regions, 
-            os.path.join(dxf_folder, f"{output_name}-{option}"), 
-            pixel_size, 
-            4 if unit == "mm" else 1, 
-            option
-            )
-        
-    # single layer DXF files
-    draw_region_outlines(regions, singles_folder, pixel_size, 4 if unit == "mm" else 1, "singles")
-
-    # printable black/white PNG file
-    array_to_scaled_png(color_array, png_folder, pixel_size, unit, line_width, dpi, output_name)
+    # every mode (and every single color DXF) is independent -> build them on separate cores
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = []
+
+        # multi layer DXF files
+        for option in dxf_options:
+            futures.append(executor.submit(
+                draw_region_outlines,
+                regions,
+                os.path.join(dxf_folder, f"{output_name}-{option}"),
+                pixel_size,
+                4 if unit == "mm" else 1,
+                option,
+                color_to_aci
+                ))
+
+        # single layer DXF files (one task per color)
+        for label, color_regions in regions.items():
+            futures.append(executor.submit(
+                draw_region_outlines,
+                {label: color_regions},
+                singles_folder,
+                pixel_size,
+                4 if unit == "mm" else 1,
+                "singles",
+                color_to_aci
+                ))
+
+        # re-raise any worker exception
+        for future in futures:
+            future.result()
+
+    # both PNG outputs spend their time in GIL-releasing Pillow/zlib calls -> overlap them
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        png_futures = [
+            # printable black/white PNG file
+            executor.submit(array_to_scaled_png, labels, png_folder, pixel_size, unit, line_width, dpi, output_name, unique_labels),
+            # single color PNG files
+            executor.submit(array_to_pngs, labels, color_array, png_singles_folder, unique_labels),
+        ]
 
-    # single color PNG files
-    array_to_pngs(color_array, png_singles_folder)
+        # re-raise any worker exception
+        for future in png_futures:
+            future.result()
 
     print("Output folder created successfully:", output_folder)
 